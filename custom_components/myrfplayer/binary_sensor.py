@@ -6,6 +6,7 @@ from typing import cast
 from custom_components.myrfplayer.const import COMMAND_GROUP_LIST, COMMAND_OFF_LIST, COMMAND_ON_LIST
 from custom_components.myrfplayer.device_profiles import AnyRfpPlatformConfig, RfpPlatformConfig, RfpSensorConfig
 from custom_components.myrfplayer.entity import RfDeviceEntity, async_setup_platform_entry
+from custom_components.myrfplayer.helpers import get_entity_description
 from custom_components.myrfplayer.rfplayerlib.device import RfDeviceEvent, RfDeviceId
 from custom_components.myrfplayer.rfplayerlib.protocol import RfPlayerEventData
 from homeassistant.components.binary_sensor import (
@@ -25,7 +26,8 @@ _LOGGER = logging.getLogger(__name__)
 def _get_entity_description(
     config: AnyRfpPlatformConfig,
 ) -> BinarySensorEntityDescription:
-    return BinarySensorEntityDescription(
+    return get_entity_description(
+        BinarySensorEntityDescription,
         key=config.name,
         device_class=BinarySensorDeviceClass(config.device_class) if config.device_class else None,
         entity_category=config.category,
@@ -79,7 +81,6 @@ class MyRfPlayerBinarySensor(RfDeviceEntity, BinarySensorEntity):
         self.entity_description = entity_description
         assert isinstance(platform_config, RfpSensorConfig)
         self._config = cast(RfpSensorConfig, platform_config)
-        self._event_data = event_data
 
     def _apply_event(self, event_data: RfPlayerEventData) -> bool:
         """Apply command from RfPlayer."""
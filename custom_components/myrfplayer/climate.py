@@ -91,7 +91,6 @@ class MyRfPlayerClimate(RfDeviceEntity, ClimateEntity):
         self.entity_description = entity_description
         assert isinstance(platform_config, RfpClimateConfig)
         self._config = cast(RfpClimateConfig, platform_config)
-        self._event_data = event_data
         self._attr_preset_modes = list(self._config.preset_modes.values())
         self._attr_preset_mode = None
 
@@ -110,14 +109,14 @@ class MyRfPlayerClimate(RfDeviceEntity, ClimateEntity):
         """Set new target hvac mode."""
         if hvac_mode == HVACMode.HEAT:
             _LOGGER.debug("set %s to heat mode", self.entity_id)
-            await self._send_command(
+            self._send_command(
                 self._config.make_cmd_turn_on(**self._command_parameters(preset_mode=self._attr_preset_mode))
             )
             self._attr_hvac_mode = hvac_mode
             self.async_write_ha_state()
         elif hvac_mode == HVACMode.OFF:
             _LOGGER.debug("set %s off mode", self.entity_id)
-            await self._send_command(
+            self._send_command(
                 self._config.make_cmd_turn_off(**self._command_parameters(preset_mode=self._attr_preset_mode))
             )
             self._attr_hvac_mode = hvac_mode
@@ -128,7 +127,7 @@ class MyRfPlayerClimate(RfDeviceEntity, ClimateEntity):
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
         _LOGGER.debug("set %s to preset %s", self.entity_id, preset_mode)
-        await self._send_command(self._config.make_cmd_set_mode(**self._command_parameters(preset_mode=preset_mode)))
+        self._send_command(self._config.make_cmd_set_mode(**self._command_parameters(preset_mode=preset_mode)))
         self._attr_preset_mode = preset_mode
         self.async_write_ha_state()
 
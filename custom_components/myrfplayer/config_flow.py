@@ -1,10 +1,10 @@
 """Config flow for MyRfPlayer integration."""
 
-import copy
 import os
-from typing import Any, cast
+from typing import Any
 
 import serial
+from serial.tools.list_ports_common import ListPortInfo
 import voluptuous as vol
 
 from custom_components.myrfplayer.device_profiles import async_get_profile_registry
@@ -72,11 +72,7 @@ class RfplayerConfigFlow(ConfigFlow):
                 return self.async_create_entry(title=device_port, data=entry_data)
 
         ports = await self.hass.async_add_executor_job(serial.tools.list_ports.comports)
-        list_of_ports = {}
-        for port in ports:
-            list_of_ports[port.device] = f"{port}, s/n: {port.serial_number or 'n/a'}" + (
-                f" - {port.manufacturer}" if port.manufacturer else ""
-            )
+        list_of_ports = {port.device: _format_port_label(port) for port in ports}
 
         data_schema = {
             vol.Exclusive(CONF_DEVICE, group_of_exclusion=SELECT_DEVICE_EXCLUSION): vol.In(list_of_ports),
@@ -221,22 +217,37 @@ class RfPlayerOptionsFlowHandler(OptionsFlow):
         devices: dict[str, Any] | None = None,
     ) -> None:
         """Update data in ConfigEntry."""
+        if not devices and all(self.config_entry.data.get(k) == v for k, v in (global_options or {}).items()):
+            return
+
         entry_data = self.config_entry.data.copy()
-        entry_data[CONF_DEVICES] = cast(dict[str, dict], copy.deepcopy(self.config_entry.data[CONF_DEVICES]))
+        # Device infos only hold immutable values, so a shallow copy is enough as long as
+        # updated device infos are replaced rather than modified in place
+        entry_data[CONF_DEVICES] = dict(self.config_entry.data[CONF_DEVICES])
         if global_options:
             entry_data.update(global_options)
         if devices:
             for id_string, device_options in devices.items():
-                entry_data[CONF_DEVICES].setdefault(id_string, {}).update(device_options)
+                entry_data[CONF_DEVICES][id_string] = {
+                    **entry_data[CONF_DEVICES].get(id_string, {}),
+                    **device_options,
+                }
 
-            entry_data[CONF_REDIRECT_ADDRESS].clear()
-            for id_string, device_info in entry_data[CONF_DEVICES].items():
+            # Only the redirects of updated devices can change, redirects to removed devices are dropped
+            entry_data[CONF_REDIRECT_ADDRESS] = {
+                redirect_id_string: id_string
+                for redirect_id_string, id_string in entry_data.get(CONF_REDIRECT_ADDRESS, {}).items()
+                if id_string not in devices and id_string in entry_data[CONF_DEVICES]
+            }
+            for id_string in devices:
+                device_info = entry_data[CONF_DEVICES][id_string]
                 if device_info.get(CONF_REDIRECT_ADDRESS):
                     redirect_device_info = device_info.copy()
                     redirect_device_info[CONF_ADDRESS] = device_info[CONF_REDIRECT_ADDRESS]
                     redirect_id_string = build_device_id_from_device_info(redirect_device_info).id_string
                     entry_data[CONF_REDIRECT_ADDRESS][redirect_id_string] = id_string
-        self.hass.config_entries.async_update_entry(self.config_entry, data=entry_data)
+        if not self.hass.config_entries.async_update_entry(self.config_entry, data=entry_data):
+            return
         self.hass.async_create_task(self.hass.config_entries.async_reload(self.config_entry.entry_id))
 
     def _list_rf_devices(self) -> dict[str, str]:
@@ -248,6 +259,11 @@ class RfPlayerOptionsFlowHandler(OptionsFlow):
         return entry.name_by_user if entry.name_by_user else entry.name or "undefined"
 
 
+def _format_port_label(port: ListPortInfo) -> str:
+    manufacturer = f" - {port.manufacturer}" if port.manufacturer else ""
+    return f"{port}, s/n: {port.serial_number or 'n/a'}{manufacturer}"
+
+
 def get_serial_by_id(dev_path: str) -> str:
     """Return a /dev/serial/by-id match for given device if available."""
     by_id = "/dev/serial/by-id"
@@ -27,6 +27,8 @@ RFPLAYER_GATEWAY = "rfplayer_gateway"
 
 DOMAIN = "myrfplayer"
 SIGNAL_RFPLAYER_EVENT = f"{DOMAIN}_event"
+SIGNAL_RFPLAYER_DEVICE_EVENT = f"{DOMAIN}_device_event_{{}}"
+SIGNAL_RFPLAYER_GROUP_EVENT = f"{DOMAIN}_group_event_{{}}_{{}}"
 SIGNAL_RFPLAYER_AVAILABILITY = f"{DOMAIN}_availability"
 
 COMMAND_ON_LIST = ["true", "1", "on", "all_on"]
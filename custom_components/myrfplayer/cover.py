@@ -76,7 +76,6 @@ class MyRfPlayerCover(RfDeviceEntity, CoverEntity):
         self.entity_description = entity_description
         assert isinstance(platform_config, RfpCoverConfig)
         self._config = cast(RfpCoverConfig, platform_config)
-        self._event_data = event_data
         if self._config.cmd_stop:
             self._attr_supported_features |= CoverEntityFeature.STOP
 
@@ -92,14 +91,14 @@ class MyRfPlayerCover(RfDeviceEntity, CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open cover."""
         _LOGGER.debug("open %s cover", self.entity_id)
-        await self._send_command(self._config.make_cmd_open(**self._command_parameters()))
+        self._send_command(self._config.make_cmd_open(**self._command_parameters()))
         self._attr_is_closed = False
         self.async_write_ha_state()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
         _LOGGER.debug("close %s cover", self.entity_id)
-        await self._send_command(self._config.make_cmd_close(**self._command_parameters()))
+        self._send_command(self._config.make_cmd_close(**self._command_parameters()))
         self._attr_is_closed = True
         self.async_write_ha_state()
 
@@ -107,7 +106,7 @@ class MyRfPlayerCover(RfDeviceEntity, CoverEntity):
         """Stop cover."""
         assert self._config.cmd_stop
         _LOGGER.debug("stop %s cover", self.entity_id)
-        await self._send_command(self._config.make_cmd_stop(**self._command_parameters()))
+        self._send_command(self._config.make_cmd_stop(**self._command_parameters()))
         self._attr_is_closed = False  # Assume open if stopped
         self.async_write_ha_state()
 
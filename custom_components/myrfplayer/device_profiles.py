@@ -1,12 +1,13 @@
 """RfPlayer device profile registry."""
 
+from collections.abc import Callable
 from enum import StrEnum
 import functools
-import json
 import logging
 import os
 from pathlib import Path
 import re
+from typing import Any
 
 from jsonpath_ng.ext import parse
 from pydantic import BaseConfig, BaseModel, parse_obj_as
@@ -17,33 +18,135 @@ from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import STATE_CLOSED, STATE_OPEN, EntityCategory, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
 
 RfDeviceClass = SensorDeviceClass | BinarySensorDeviceClass
 _LOGGER = logging.getLogger(__name__)
 
+# Use libyaml bindings when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_KEYS = r"((?:\.[A-Za-z_][A-Za-z0-9_]*)+)"
+_SIMPLE_JSON_PATH = re.compile(rf"^\${_KEYS}$")
+# Single equality filter on a list like $.frame.infos.measures[?(@.type=='temperature')].value
+_FILTER_JSON_PATH = re.compile(rf"^\${_KEYS}\[\?\(@\.([A-Za-z_][A-Za-z0-9_]*)==(['\"])([^'\"]*)\3\)\]{_KEYS}?$")
+_MISSING = object()
 
-class BaseValueConfig(BaseModel):
+JsonPathFinder = Callable[[Any], Any]
+
+
+def _walk(value: Any, keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _split_keys(path: str | None) -> tuple[str, ...]:
+    return tuple(path.split(".")[1:]) if path else ()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_json_path(json_path: str) -> JsonPathFinder:
+    """Compile a json path once into a finder returning the first match or _MISSING.
+
+    Plain dotted paths and single equality filters, which cover the bundled profiles, are resolved with
+    dict lookups. Other paths fall back to jsonpath-ng.
+    """
+    if match := _SIMPLE_JSON_PATH.match(json_path):
+        keys = _split_keys(match[1])
+        return lambda event_data: _walk(event_data, keys)
+
+    if match := _FILTER_JSON_PATH.match(json_path):
+        prefix, field, expected, suffix = _split_keys(match[1]), match[2], match[4], _split_keys(match[5])
+
+        def find_filtered(event_data: Any) -> Any:
+            items = _walk(event_data, prefix)
+            # Like jsonpath-ng, filters apply to the values of a map
+            if isinstance(items, dict):
+                items = items.values()
+            elif not isinstance(items, list):
+                return _MISSING
+            for item in items:
+                if isinstance(item, dict) and item.get(field) == expected:
+                    value = _walk(item, suffix)
+                    if value is not _MISSING:
+                        return value
+            return _MISSING
+
+        return find_filtered
+
+    expr = parse(json_path)
+
+    def find_jsonpath(event_data: Any) -> Any:
+        all_match = expr.find(event_data)
+        return all_match[0].value if all_match else _MISSING
+
+    return find_jsonpath
+
+
+class _PrivateAttrsModel(BaseModel):
+    """Base model keeping precomputed underscore attributes out of the model fields."""
+
+    class Config(BaseConfig):
+        """Enable private properties."""
+
+        underscore_attrs_are_private = True
+
+
+class BaseValueConfig(_PrivateAttrsModel):
     """Base value extractor."""
 
     bit_mask: int | None
     bit_offset: int | None
     map: dict[str, str] | None
     factor: float | None
+    _pipeline: list[Callable[[Any], Any]]
+
+    def __init__(self, **data: Any) -> None:
+        """Create the config and chain only the configured conversions."""
+        super().__init__(**data)
+        self._pipeline = []
+        bits = self._build_bits_op()
+        factor = self.factor
+        if value_map := self.map:
+            # Mapped values are strings, so the masked value is mapped from its string form
+            if bits:
+                self._pipeline.append(lambda value: str(bits(value)))
+            self._pipeline.append(lambda value: value_map.get(value, "undefined"))
+            if factor:
+                self._pipeline.append(lambda value: float(value) * factor)
+        elif bits and factor:
+            self._pipeline.append(lambda value: bits(value) * factor)
+        elif bits:
+            self._pipeline.append(bits)
+        elif factor:
+            self._pipeline.append(lambda value: float(value) * factor)
+
+    def _build_bits_op(self) -> Callable[[Any], int] | None:
+        """Build the bit operations, with mask and offset sharing a single int parse."""
+        bit_mask, bit_offset = self.bit_mask, self.bit_offset
+        if bit_mask and bit_offset:
+            return lambda value: (int(value) & bit_mask) >> bit_offset
+        if bit_mask:
+            return lambda value: int(value) & bit_mask
+        if bit_offset:
+            return lambda value: int(value) >> bit_offset
+        return None
 
-    def _convert(self, value: str) -> str:
-        """Convert a raw value."""
+    def _apply(self, value: Any) -> Any:
+        """Apply the conversions to a raw value, keeping numbers as numbers."""
 
         result = value
-        if self.bit_mask:
-            result = str(int(result) & self.bit_mask)
-        if self.bit_offset:
-            result = str(int(result) >> self.bit_offset)
-        if self.map:
-            result = self.map.get(result, "undefined")
-        if self.factor:
-            result = str(float(result) * self.factor)
+        for op in self._pipeline:
+            result = op(result)
         return result
 
+    def _convert(self, value: Any) -> Any:
+        """Convert a raw value to its string form."""
+
+        return str(self._apply(value)) if self._pipeline else value
+
 
 class JsonValueConfig(BaseValueConfig):
     """Generic json value extraction configuration."""
@@ -55,6 +158,21 @@ class JsonValueConfig(BaseValueConfig):
         """Extract value from json event."""
         return self._find_value(event_data, self.value_path)
 
+    def get_number(self, event_data: RfPlayerEventData) -> float | None:
+        """Extract numeric value from json event, without going through its string form.
+
+        Raises ValueError if the value is not numeric.
+        """
+        value = _compile_json_path(self.value_path)(event_data)
+        if value is _MISSING or value is None or value == "":
+            return None
+        return float(self._apply(value))
+
+    def get_raw_value(self, event_data: RfPlayerEventData) -> Any:
+        """Extract value from json event, without any conversion."""
+        value = _compile_json_path(self.value_path)(event_data)
+        return None if value is _MISSING else value
+
     def get_unit(self, event_data: RfPlayerEventData) -> str | None:
         """Extract value from json event."""
         return self._find_value(event_data, self.unit_path) if self.unit_path else None
@@ -62,14 +180,13 @@ class JsonValueConfig(BaseValueConfig):
     def _find_value(self, event_data: RfPlayerEventData, json_path: str) -> str | None:
         """Extract value from json event."""
 
-        expr = parse(json_path)
-        all_match = expr.find(event_data)
-        if all_match:
-            return self._convert(all_match[0].value)
-        return None
+        value = _compile_json_path(json_path)(event_data)
+        if value is _MISSING:
+            return None
+        return self._convert(value)
 
 
-class RfpPlatformConfig(BaseModel):
+class RfpPlatformConfig(_PrivateAttrsModel):
     """Base class for all platform configurations."""
 
     name: str
@@ -77,11 +194,6 @@ class RfpPlatformConfig(BaseModel):
     category: EntityCategory | None
     unit: str | None
 
-    class Config(BaseConfig):
-        """Enable private properties for map caching."""
-
-        underscore_attrs_are_private = True
-
 
 class RfpSensorConfig(RfpPlatformConfig):
     """Sensor platform configuration."""
@@ -115,7 +227,14 @@ class RfpClimateConfig(RfpPlatformConfig):
     cmd_turn_on: str
     cmd_turn_off: str
     cmd_set_mode: str | None
-    _preset_modes_cache: dict[str, str] | None = None
+    _preset_modes_cache: dict[str, str]
+    _default_preset_code: str | None
+
+    def __init__(self, **data: Any) -> None:
+        """Create the config and invert the preset modes once."""
+        super().__init__(**data)
+        self._preset_modes_cache = {value: key for (key, value) in self.preset_modes.items()}
+        self._default_preset_code = next(iter(self._preset_modes_cache.values()), None)
 
     def make_cmd_turn_on(self, **kwargs):
         """Format the turn on command with address."""
@@ -136,9 +255,7 @@ class RfpClimateConfig(RfpPlatformConfig):
         return self.cmd_set_mode.format(**kwargs)
 
     def _mode_to_code(self, mode: str | None):
-        if not self._preset_modes_cache:
-            self._preset_modes_cache = {value: key for (key, value) in self.preset_modes.items()}
-        return self._preset_modes_cache[mode] if mode else list(self._preset_modes_cache.values())[0]
+        return self._preset_modes_cache[mode] if mode else self._default_preset_code
 
 
 class CoverState(StrEnum):
@@ -205,7 +322,7 @@ class RfpLightConfig(RfpSwitchConfig):
 AnyRfpPlatformConfig = RfpClimateConfig | RfpSensorConfig | RfpCoverConfig | RfpSwitchConfig | RfpLightConfig
 
 
-class RfpPlatformConfigMap(BaseModel):
+class RfpPlatformConfigMap(_PrivateAttrsModel):
     """Explicit plaform config map.
 
     Remove deserialization ambiguity with union and avoid using pydantic discriminator.
@@ -217,19 +334,51 @@ class RfpPlatformConfigMap(BaseModel):
     light: list[RfpLightConfig] | None
     sensor: list[RfpSensorConfig] | None
     switch: list[RfpSwitchConfig] | None
+    _by_platform: dict[str, list[AnyRfpPlatformConfig]]
+
+    def __init__(self, **data: Any) -> None:
+        """Create the map and index the configured platforms."""
+        super().__init__(**data)
+        self._by_platform = {platform: configs for platform, configs in vars(self).items() if configs}
 
     def get(self, platform: Platform) -> list[AnyRfpPlatformConfig]:
         """Return the config for the given platform."""
-        return vars(self).get(platform, [])
+        return self._by_platform.get(platform, [])
 
 
-class RfPDeviceMatch(BaseModel):
+class RfPDeviceMatch(_PrivateAttrsModel):
     """Frame matching rule to detect device."""
 
     protocol: str
     info_type: str
     sub_type: str | None
     id_phy: str | None
+    _protocol_match: Callable[[str], bool]
+    _id_phy_match: Callable[[str], bool] | None
+
+    def __init__(self, **data: Any) -> None:
+        """Create the rule and compile its patterns once."""
+        super().__init__(**data)
+        self._protocol_match = _compile_match(self.protocol)
+        self._id_phy_match = _compile_match(self.id_phy) if self.id_phy else None
+
+    def match_protocol(self, protocol: str) -> bool:
+        """Check if the protocol matches the rule."""
+        return self._protocol_match(protocol)
+
+    def match_id_phy(self, id_phy: str) -> bool:
+        """Check if the physical id matches the rule."""
+        return self._id_phy_match is None or self._id_phy_match(id_phy)
+
+
+def _compile_match(pattern: str) -> Callable[[str], bool]:
+    """Compile a match rule, using a prefix test when the pattern is only literal alternatives like A|B."""
+    alternatives = tuple(pattern.split("|"))
+    if all(re.escape(alternative) == alternative for alternative in alternatives):
+        # Same result as re.match, which only anchors at the start
+        return lambda value: value.startswith(alternatives)
+    regex = re.compile(pattern)
+    return lambda value: regex.match(value) is not None
 
 
 class RfpDeviceProfile(BaseModel):
@@ -240,12 +389,22 @@ class RfpDeviceProfile(BaseModel):
     platforms: RfpPlatformConfigMap
 
 
+# Event fields used for profile matching: protocol, info type, sub type and physical id
+EventShape = tuple[str | None, str | None, str | None, str | None]
+
+
 class ProfileRegistry:
     """Registry to store RF device profiles."""
 
     def __init__(self, filename: Path, verbose: bool):
         """Create a new registry."""
         self._registry: list[RfpDeviceProfile] = []
+        self._profiles_by_name: dict[str, RfpDeviceProfile] = {}
+        # Info type is an exact match, so only the profiles of the event's info type need to be scanned
+        self._profiles_by_info_type: dict[str, list[RfpDeviceProfile]] = {}
+        self._profile_names: tuple[str, ...] = ()
+        # Matching only depends on a few header and infos fields, so cache the result per event shape
+        self._profile_name_cache: dict[EventShape, str | None] = {}
         self.verbose = verbose
         with open(filename, encoding="utf-8") as f:
             self.register_profiles(f.read())
@@ -253,20 +412,32 @@ class ProfileRegistry:
     def register_profiles(self, content: str) -> None:
         """Add new yaml device profiles into the registry."""
 
-        obj = yaml.safe_load(content)
+        obj = yaml.load(content, Loader=_YamlLoader)
         items = parse_obj_as(list[RfpDeviceProfile], obj)
         self._registry.extend(items)
+        for item in items:
+            # First registered profile wins, like when matching events
+            self._profiles_by_name.setdefault(item.name, item)
+            self._profiles_by_info_type.setdefault(item.match.info_type, []).append(item)
+        self._profile_names = tuple(item.name for item in self._registry)
+        self._profile_name_cache.clear()
 
     def get_profile_name_from_event(self, event_data: RfPlayerEventData) -> str | None:
         """Get a plaform config matching an event."""
-        matching_profiles = (entry for entry in self._registry if self._event_is_matching(event_data, entry))
+        shape = self._event_shape(event_data)
+        if shape in self._profile_name_cache:
+            return self._profile_name_cache[shape]
+
+        candidates = self._profiles_by_info_type.get(shape[1] or "", [])
+        matching_profiles = (entry for entry in candidates if self._event_is_matching(shape, entry))
 
         profile = next(matching_profiles, None)
 
-        if not profile:
-            _LOGGER.info("No matching profile for event %s", json.dumps(event_data))
-            return None
-        return profile.name
+        if not profile and _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("No matching profile for event %s", json_dumps(event_data))
+        profile_name = profile.name if profile else None
+        self._profile_name_cache[shape] = profile_name
+        return profile_name
 
     def get_platform_config(self, profile_name: str | None, platform: Platform) -> list[AnyRfpPlatformConfig]:
         """Get a plaform config matching an event."""
@@ -281,9 +452,9 @@ class ProfileRegistry:
 
         return platform_config
 
-    def get_profile_names(self) -> list[str]:
+    def get_profile_names(self) -> tuple[str, ...]:
         """Get the list of available profile names."""
-        return [item.name for item in self._registry]
+        return self._profile_names
 
     def is_valid_protocol(self, profile_name: str, protocol: str) -> bool:
         """Check if a protocol is valid for the given profile."""
@@ -292,57 +463,55 @@ class ProfileRegistry:
         if profile is None:
             return False
 
-        return re.match(profile.match.protocol, protocol) is not None
+        return profile.match.match_protocol(protocol)
 
     def _get_profile(self, profile_name: str | None) -> RfpDeviceProfile | None:
         if not profile_name:
             _LOGGER.warning("No profile name provided")
             return None
 
-        matching_profiles = (entry for entry in self._registry if entry.name == profile_name)
-
-        profile = next(matching_profiles, None)
+        profile = self._profiles_by_name.get(profile_name)
 
         if not profile:
             _LOGGER.warning("Profile name %s not supported", profile_name)
             return None
         return profile
 
-    def _event_is_matching(self, event_data: RfPlayerEventData, profile: RfpDeviceProfile):
+    def _event_shape(self, event_data: RfPlayerEventData) -> EventShape:
+        header = event_data["frame"]["header"]
+        infos = event_data["frame"]["infos"]
+        return (header.get("protocolMeaning"), header.get("infoType"), infos.get("subType"), infos.get("id_PHY"))
+
+    def _event_is_matching(self, shape: EventShape, profile: RfpDeviceProfile) -> bool:
         m = profile.match
-        if m.protocol:
-            protocol = event_data["frame"]["header"]["protocolMeaning"]
-            if not re.match(m.protocol, protocol):
-                self._verbose_debug(
-                    "profile %s not matching: expected protocol %s, actual %s",
-                    profile.name,
-                    m.protocol,
-                    protocol,
-                )
-                return False
-        info_type = event_data["frame"]["header"]["infoType"]
+        protocol, info_type, sub_type, id_phy = shape
+        # Cheap equality checks first, patterns last
         if info_type != m.info_type:
             self._verbose_debug(
                 "profile %s not matching: expected info type %s, actual %s", profile.name, m.info_type, info_type
             )
             return False
-        if m.sub_type:
-            sub_type = event_data["frame"]["infos"]["subType"]
-            if sub_type != m.sub_type:
-                self._verbose_debug(
-                    "profile %s not matching: expected sub type %s, actual %s",
-                    profile.name,
-                    m.sub_type,
-                    sub_type,
-                )
-                return False
-        if m.id_phy:
-            id_phy = event_data["frame"]["infos"]["id_PHY"]
-            if not re.match(m.id_phy, id_phy):
-                self._verbose_debug(
-                    "profile %s not matching: expected id phy %s, actual %s", profile.name, m.id_phy, id_phy
-                )
-                return False
+        if m.sub_type and sub_type != m.sub_type:
+            self._verbose_debug(
+                "profile %s not matching: expected sub type %s, actual %s",
+                profile.name,
+                m.sub_type,
+                sub_type,
+            )
+            return False
+        if m.protocol and (protocol is None or not m.match_protocol(protocol)):
+            self._verbose_debug(
+                "profile %s not matching: expected protocol %s, actual %s",
+                profile.name,
+                m.protocol,
+                protocol,
+            )
+            return False
+        if m.id_phy and (id_phy is None or not m.match_id_phy(id_phy)):
+            self._verbose_debug(
+                "profile %s not matching: expected id phy %s, actual %s", profile.name, m.id_phy, id_phy
+            )
+            return False
         return True
 
     def _verbose_debug(self, msg, *args, **kwargs):
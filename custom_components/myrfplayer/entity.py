@@ -1,7 +1,7 @@
 """Support for RF devices."""
 
 from collections.abc import Callable
-import json
+import functools
 import logging
 from typing import cast
 
@@ -10,8 +10,9 @@ import slugify
 from custom_components.myrfplayer.device_profiles import AnyRfpPlatformConfig, async_get_profile_registry
 from custom_components.myrfplayer.helpers import (
     build_device_id_from_device_info,
-    build_device_info_from_event,
     build_event_data_from_device_info,
+    get_device_event_signal,
+    get_group_event_signal,
     get_identifiers_from_device_id,
 )
 from custom_components.myrfplayer.rfplayerlib import RfPlayerClient
@@ -24,7 +25,9 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util.json import json_loads_object
 
 from .const import (
     ATTR_EVENT_DATA,
@@ -39,6 +42,12 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _unique_id(id_string: str, name: str) -> str:
+    """Build a slugified unique id, cached since entities are rebuilt with the same ids on every reload."""
+    return slugify.slugify(f"{id_string}.{name}")
+
+
 async def async_setup_platform_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -51,10 +60,11 @@ async def async_setup_platform_entry(
 ) -> None:
     """Set up config entry."""
     entry_data = config_entry.data
-    # Set of device IDs already configured for the current platform
+    verbose = entry_data.get(CONF_VERBOSE_MODE, False)
+    # Set of device IDs already processed for the current platform
     string_ids: set[str] = set()
 
-    profile_registry = await async_get_profile_registry(hass, entry_data.get(CONF_VERBOSE_MODE, False))
+    profile_registry = await async_get_profile_registry(hass, verbose)
 
     # Add entities from config
     entities = []
@@ -67,6 +77,10 @@ async def async_setup_platform_entry(
             )
             continue
 
+        # Configured devices keep their profile, even when it doesn't support the current platform,
+        # so they must not be matched again on incoming events
+        string_ids.add(id_string)
+
         profile_name = device_info.get(CONF_PROFILE_NAME)
         if profile_name is None:
             _LOGGER.warning("Missing profile in device info for %s", id_string)
@@ -79,8 +93,7 @@ async def async_setup_platform_entry(
         device_id = build_device_id_from_device_info(device_info)
         event_data = build_event_data_from_device_info(device_info)
 
-        string_ids.add(id_string)
-        entities.extend(builder(device_id, platform_config, event_data, entry_data.get(CONF_VERBOSE_MODE, False)))
+        entities.extend(builder(device_id, platform_config, event_data, verbose))
 
     async_add_entities(entities)
 
@@ -97,16 +110,13 @@ async def async_setup_platform_entry(
             # regardless of whether the platform is supported or not
             string_ids.add(event.device.id_string)
 
-            device_info = build_device_info_from_event(profile_registry, event)
-            device_id = build_device_id_from_device_info(device_info)
-            platform_config = profile_registry.get_platform_config(device_info[CONF_PROFILE_NAME], platform)
+            profile_name = profile_registry.get_profile_name_from_event(event.data)
+            platform_config = profile_registry.get_platform_config(profile_name, platform)
             if not platform_config:
                 _LOGGER.debug("Device %s does not support platform %s", event.device.id_string, platform)
                 return
 
-            async_add_entities(
-                builder(device_id, platform_config, event.data, entry_data.get(CONF_VERBOSE_MODE, False))
-            )
+            async_add_entities(builder(event.device, platform_config, event.data, verbose))
 
         config_entry.async_on_unload(
             async_dispatcher_connect(hass, SIGNAL_RFPLAYER_EVENT, _update)  # type: ignore[has-type]
@@ -124,6 +134,8 @@ class RfDeviceEntity(RestoreEntity):
     _attr_should_poll = False
     _device_id: RfDeviceId
     _event_data: RfPlayerEventData | None
+    _event_data_json: str | None
+    _client: RfPlayerClient
 
     def __init__(self, device_id: RfDeviceId, name: str, event_data: RfPlayerEventData | None, verbose: bool) -> None:
         """Initialize the device."""
@@ -136,27 +148,39 @@ class RfDeviceEntity(RestoreEntity):
             else f"{device_id.protocol} {device_id.address}",
         )
         self.name = name
-        self._attr_unique_id = slugify.slugify(f"{device_id.id_string}.{name}")
-        self._event_data = event_data
+        self._attr_unique_id = _unique_id(device_id.id_string, name)
+        self._set_event_data(event_data)
         self._device_id = device_id
         self.entity_id = f"{DOMAIN}.{device_id.id_string}.{name}"
         self._verbose = verbose
 
     async def async_added_to_hass(self) -> None:
         """Restore RfPlayer device from last event stored in attributes."""
+        # The client is created once by the gateway and kept for the whole config entry lifetime
+        self._client = cast(RfPlayerClient, self.hass.data[DOMAIN][RFPLAYER_CLIENT])
+
         if self._event_data is None and (old_state := await self.async_get_last_state()) is not None:
             json_event_data = cast(str, old_state.attributes.get(ATTR_EVENT_DATA))
-            self._event_data = json.loads(json_event_data) if json_event_data else None
-
-        if self._event_data:
+            if json_event_data:
+                self._apply_event(cast(RfPlayerEventData, json_loads_object(json_event_data)))
+                # Reuse the restored string instead of serializing the same event again
+                self._event_data_json = json_event_data
+        elif self._event_data:
             self._apply_event(self._event_data)
 
         self.async_on_remove(
             async_dispatcher_connect(  # type: ignore[has-type]
-                self.hass, SIGNAL_RFPLAYER_EVENT, self._handle_event
+                self.hass, get_device_event_signal(self._device_id), self._handle_event
             )
         )
 
+        if group_signal := get_group_event_signal(self._device_id):
+            self.async_on_remove(
+                async_dispatcher_connect(  # type: ignore[has-type]
+                    self.hass, group_signal, self._handle_group_event
+                )
+            )
+
         self.async_on_remove(
             async_dispatcher_connect(  # type: ignore[has-type]
                 self.hass, SIGNAL_RFPLAYER_AVAILABILITY, self._handle_availability
@@ -168,36 +192,42 @@ class RfDeviceEntity(RestoreEntity):
         """Return the device state attributes."""
         if not self._event_data:
             return None
-        return {ATTR_EVENT_DATA: json.dumps(self._event_data)}
-
-    def _event_applies(self, event: RfDeviceEvent) -> bool:
-        """Check if event applies to me."""
-        if self._group_event(event):
-            return (event.device.protocol == self._device_id.protocol) and (
-                event.device.group_code == self._device_id.group_code
-            )
-        return event.device.id_string == self._device_id.id_string
+        if self._event_data_json is None:
+            self._event_data_json = json_dumps(self._event_data)
+        return {ATTR_EVENT_DATA: self._event_data_json}
 
     def _group_event(self, event: RfDeviceEvent) -> bool:
         return False
 
     def _apply_event(self, event_data: RfPlayerEventData) -> bool:
         """Apply a received event."""
-        self._event_data = event_data
+        self._set_event_data(event_data)
         return True
 
+    def _set_event_data(self, event_data: RfPlayerEventData | None) -> None:
+        # Serialized lazily, at most once per event, when state attributes are read
+        self._event_data = event_data
+        self._event_data_json = None
+
     @callback
     def _handle_event(self, event: RfDeviceEvent) -> None:
-        """Check if event applies to me and update."""
-        if not self._event_applies(event):
-            return
-
+        """Update from an event of my device."""
         if self._apply_event(event.data):
             _LOGGER.debug("%s updated", self.entity_id)
             self.async_write_ha_state()
         elif self._verbose:
             _LOGGER.debug("%s not updated", self.entity_id)
 
+    @callback
+    def _handle_group_event(self, event: RfDeviceEvent) -> None:
+        """Handle an event from another device of my group."""
+        # Events of my own device are already received through the device signal,
+        # the group signal is keyed by protocol and group code so only the event kind remains to check
+        if event.device.id_string == self._device_id.id_string or not self._group_event(event):
+            return
+
+        self._handle_event(event)
+
     @callback
     def _handle_availability(self, available: bool) -> None:
         self._attr_available = available
@@ -205,9 +235,9 @@ class RfDeviceEntity(RestoreEntity):
             _LOGGER.debug("%s availability updated %s", self.entity_id, str(available))
         self.async_write_ha_state()
 
-    async def _send_command(self, command: str):
-        client = cast(RfPlayerClient, self.hass.data[DOMAIN][RFPLAYER_CLIENT])
-        await self.hass.async_add_executor_job(client.send_raw_command, command)
+    def _send_command(self, command: str) -> None:
+        # Writing to the asyncio transport is non blocking and must happen in the event loop
+        self._client.send_raw_command(command)
 
     def _command_parameters(self, **kwargs) -> dict:
         params = {
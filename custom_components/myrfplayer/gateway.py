@@ -1,15 +1,19 @@
 """RfPlayer gateway."""
 
 import asyncio
-import copy
-import json
+import dataclasses
 import logging
-from typing import cast
+from typing import Any, cast
 
 import voluptuous as vol
 
 from custom_components.myrfplayer.device_profiles import async_get_profile_registry
-from custom_components.myrfplayer.helpers import build_device_info_from_event, get_device_id_string_from_identifiers
+from custom_components.myrfplayer.helpers import (
+    build_device_info_from_event,
+    get_device_event_signal,
+    get_device_id_string_from_identifiers,
+    get_group_event_signal,
+)
 from custom_components.myrfplayer.rfplayerlib import COMMAND_PROTOCOLS, RfPlayerClient, RfPlayerException
 from custom_components.myrfplayer.rfplayerlib.device import RfDeviceEvent
 from homeassistant.config_entries import ConfigEntry
@@ -22,12 +26,13 @@ from homeassistant.const import (
     CONF_PROTOCOL,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import CoreState, Event, HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HassJob, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.device_registry import EventDeviceRegistryUpdatedData
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
 
 from .const import (
     ATTR_COMMAND,
@@ -50,13 +55,26 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-SERVICE_SEND_RAW_COMMAND_SCHEMA = vol.Schema({ATTR_COMMAND: str})
-SERVICE_SEND_PAIRING_COMMAND_SCHEMA = vol.Schema({CONF_PROTOCOL: vol.In(COMMAND_PROTOCOLS), CONF_ADDRESS: str})
-SERVICE_SIMULATE_EVENT_SCHEMA = vol.Schema({ATTR_EVENT_DATA: dict})
+SERVICE_SEND_RAW_COMMAND_SCHEMA = vol.Schema({vol.Required(ATTR_COMMAND): cv.string})
+SERVICE_SEND_PAIRING_COMMAND_SCHEMA = vol.Schema(
+    {vol.Required(CONF_PROTOCOL): vol.In(COMMAND_PROTOCOLS), vol.Required(CONF_ADDRESS): cv.string}
+)
+SERVICE_SIMULATE_EVENT_SCHEMA = vol.Schema({vol.Required(ATTR_EVENT_DATA): dict})
 
 JAMMING_DEVICE_ID_STRING = "JAMMING_0"
 JAMMING_DEVICE_INFO = {CONF_PROTOCOL: "JAMMING", CONF_ADDRESS: "0", CONF_PROFILE_NAME: "Jamming Detector"}
 
+# Delay to group devices discovered in a burst into a single config entry update
+ADD_DEVICE_DELAY = 1.0
+# Window during which identical frames of a device are considered as RF retransmissions
+DUPLICATE_EVENT_WINDOW = 0.5
+
+
+@callback
+def _is_device_removed(event_data: EventDeviceRegistryUpdatedData) -> bool:
+    """Only device removals need to be forwarded to the gateway."""
+    return event_data["action"] == "remove"
+
 
 class Gateway:
     """RfPlayer gateway."""
@@ -68,6 +86,14 @@ class Gateway:
         self.entry = entry
         self.config = entry.data
         self.device_registry = dr.async_get(hass)
+        self._pending_devices: dict[str, dict] = {}
+        self._cancel_pending_devices: CALLBACK_TYPE | None = None
+        # Last forwarded sensor frame per device, ordered by forward time
+        self._last_events: dict[str, tuple[float, dict]] = {}
+        self._available: bool | None = None
+        # Options changes reload the entry, so these can be read once
+        self._automatic_add: bool = self.config[CONF_AUTOMATIC_ADD]
+        self._redirect_address: dict[str, str] = self.config[CONF_REDIRECT_ADDRESS]
         # All RfPlayer gateways are configured by default with a Jamming detector
         self.config[CONF_DEVICES].update({JAMMING_DEVICE_ID_STRING: JAMMING_DEVICE_INFO})
 
@@ -89,13 +115,15 @@ class Gateway:
         )
         self.hass.data[DOMAIN][RFPLAYER_CLIENT] = client
 
-        await self.entry.async_create_task(self.hass, self._connect_gateway())
+        await self._connect_gateway()
 
         self.entry.async_on_unload(
-            self.hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._updated_rf_device)
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._updated_rf_device, event_filter=_is_device_removed
+            )
         )
 
-        self.entry.async_on_unload(self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, lambda _: client.close()))
+        self.entry.async_on_unload(self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._handle_stop))
 
         self.hass.services.async_register(
             DOMAIN,
@@ -121,28 +149,74 @@ class Gateway:
 
         self.hass.services.async_remove(DOMAIN, SERVICE_SEND_RAW_COMMAND)
 
-        await self.hass.async_add_executor_job(self._get_client().close)
+        self._save_pending_devices()
+
+        # Closing the asyncio transport doesn't block and must be done in the event loop
+        self._get_client().close()
 
     @callback
     def _async_handle_receive(self, event: RfDeviceEvent) -> None:
         """Event handler connected to the client."""
 
         _LOGGER.debug("Received event from %s", event.device.id_string)
-        if self.verbose:
-            _LOGGER.debug("Event data %s", json.dumps(event.data))
+        if self.verbose and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Event data %s", json_dumps(event.data))
 
-        if event.device.id_string not in self.entry.data[CONF_DEVICES] and self.config[CONF_AUTOMATIC_ADD]:
+        if self._is_duplicate_event(event):
+            if self.verbose:
+                _LOGGER.debug("Dropping repeated frame from %s", event.device.id_string)
+            return
+
+        if (
+            event.device.id_string not in self.entry.data[CONF_DEVICES]
+            and event.device.id_string not in self._pending_devices
+            and self._automatic_add
+        ):
             self._add_rf_device(event)
             # Still send event for group events
 
         # Replace event address if device has redirect configuration
-        if event.device.id_string in self.config[CONF_REDIRECT_ADDRESS]:
-            redirected_id_string = self.config[CONF_REDIRECT_ADDRESS][event.device.id_string]
-            event.device.address = self.config[CONF_DEVICES][redirected_id_string][CONF_ADDRESS]
+        if (redirected_id_string := self._redirect_address.get(event.device.id_string)) is not None:
+            event.device = dataclasses.replace(
+                event.device, address=self.config[CONF_DEVICES][redirected_id_string][CONF_ADDRESS]
+            )
 
         # Callback to HA registered components.
         async_dispatcher_send(self.hass, SIGNAL_RFPLAYER_EVENT, event)  # type: ignore[has-type]
 
+        # Entities only listen to their own device and group signals
+        async_dispatcher_send(self.hass, get_device_event_signal(event.device), event)  # type: ignore[has-type]
+        if group_signal := get_group_event_signal(event.device):
+            async_dispatcher_send(self.hass, group_signal, event)  # type: ignore[has-type]
+
+    def _is_duplicate_event(self, event: RfDeviceEvent) -> bool:
+        infos = event.data["frame"]["infos"]
+        # Only sensor readings are retransmitted, every command press or state change matters.
+        # Simulated events are explicit requests and never retransmissions.
+        if event.simulated or "measures" not in infos:
+            return False
+
+        # Only compare infos as header radio levels change between retransmissions
+        now = self.hass.loop.time()
+        id_string = event.device.id_string
+        last_event = self._last_events.get(id_string)
+        if last_event and now - last_event[0] < DUPLICATE_EVENT_WINDOW and last_event[1] == infos:
+            return True
+
+        # The window starts from the last forwarded frame so that repeated frames can't extend it
+        self._last_events.pop(id_string, None)
+        self._last_events[id_string] = (now, infos)
+        self._evict_expired_events(now)
+        return False
+
+    def _evict_expired_events(self, now: float) -> None:
+        # Entries are kept in forward order, so expired ones are always first
+        while self._last_events:
+            id_string, (last_time, _) = next(iter(self._last_events.items()))
+            if now - last_time < DUPLICATE_EVENT_WINDOW:
+                break
+            del self._last_events[id_string]
+
     @callback
     def _add_rf_device(self, event: RfDeviceEvent) -> None:
         device_info = build_device_info_from_event(self.profile_registry, event)
@@ -150,10 +224,9 @@ class Gateway:
             _LOGGER.info("No matching profile for device %s", event.device.id_string)
             return
 
-        data = self.entry.data.copy()
-        data[CONF_DEVICES] = copy.deepcopy(self.entry.data[CONF_DEVICES])
-        data[CONF_DEVICES][event.device.id_string] = device_info
-        self.hass.config_entries.async_update_entry(entry=self.entry, data=data)
+        self._pending_devices[event.device.id_string] = device_info
+        if self._cancel_pending_devices is None:
+            self._cancel_pending_devices = async_call_later(self.hass, ADD_DEVICE_DELAY, self._save_pending_devices)
         _LOGGER.debug(
             "Device %s added (Proto: %s Addr: %s Model: %s)",
             event.device.id_string,
@@ -163,27 +236,45 @@ class Gateway:
         )
 
     @callback
-    def _remove_rf_device(self, id_string: str) -> None:
+    def _save_pending_devices(self, _now: Any = None) -> None:
+        if self._cancel_pending_devices:
+            self._cancel_pending_devices()
+            self._cancel_pending_devices = None
+
+        if not self._pending_devices:
+            return
+
+        # Device infos are never mutated in place, so sharing them with the previous entry data is safe
         data = {
             **self.entry.data,
-            CONF_DEVICES: {
-                device_config_id: entity_info
-                for device_config_id, entity_info in self.entry.data[CONF_DEVICES].items()
-                if device_config_id != id_string
-            },
+            CONF_DEVICES: {**self.entry.data[CONF_DEVICES], **self._pending_devices},
         }
+        self._pending_devices = {}
+        self.hass.config_entries.async_update_entry(entry=self.entry, data=data)
+
+    @callback
+    def _remove_rf_device(self, id_string: str) -> None:
+        self._pending_devices.pop(id_string, None)
+        if id_string not in self.entry.data[CONF_DEVICES]:
+            _LOGGER.debug("Device %s already removed", id_string)
+            return
+
+        devices = {**self.entry.data[CONF_DEVICES]}
+        devices.pop(id_string)
+        data = {**self.entry.data, CONF_DEVICES: devices}
         self.hass.config_entries.async_update_entry(entry=self.entry, data=data)
         _LOGGER.debug(
             "Device %s removed",
             id_string,
         )
 
+    @callback
+    def _handle_stop(self, _event: Event) -> None:
+        self._save_pending_devices()
+        self._get_client().close()
+
     @callback
     def _updated_rf_device(self, event: Event[EventDeviceRegistryUpdatedData]) -> None:
-        if event.data["action"] != "remove":
-            if self.verbose:
-                _LOGGER.debug("Doing nothing on action %s", event.data["action"])
-            return
         device_entry = self.device_registry.deleted_devices[event.data[ATTR_DEVICE_ID]]
         if self.entry.entry_id not in device_entry.config_entries:
             _LOGGER.debug("Entry id %s is not a deleted device", self.entry.entry_id)
@@ -210,7 +301,7 @@ class Gateway:
             reconnect_interval = self.config[CONF_RECONNECT_INTERVAL]
             _LOGGER.exception("Error connecting to RfPlayer, reconnecting in %s", reconnect_interval)
             # Connection to RfPlayer gateway is lost, make entities unavailable
-            async_dispatcher_send(self.hass, SIGNAL_RFPLAYER_AVAILABILITY, False)  # type: ignore[has-type]
+            self._set_availability(False)
 
             reconnect_job = HassJob(self._reconnect_gateway, "RfPlayer reconnect", cancel_on_shutdown=True)
             async_call_later(self.hass, reconnect_interval, reconnect_job)
@@ -219,7 +310,7 @@ class Gateway:
 
         # There is a valid connection to a RfPlayer gateway now so
         # mark entities as available
-        async_dispatcher_send(self.hass, SIGNAL_RFPLAYER_AVAILABILITY, True)  # type: ignore[has-type]
+        self._set_availability(True)
 
         _LOGGER.debug("Connected to RfPlayer")
 
@@ -231,13 +322,22 @@ class Gateway:
         else:
             _LOGGER.info("Connection explicitly closed")
 
-        async_dispatcher_send(self.hass, SIGNAL_RFPLAYER_AVAILABILITY, False)  # type: ignore[has-type]
+        self._set_availability(False)
 
         # If HA is not stopping, initiate new connection
         if self.hass.state is not CoreState.stopping:
             _LOGGER.warning("Disconnected from RfPlayer, reconnecting")
             self.hass.async_create_task(self._connect_gateway(), eager_start=False)
 
+    @callback
+    def _set_availability(self, available: bool) -> None:
+        # Skip notifying all entities again when the availability didn't change, e.g. on repeated reconnect failures
+        if available == self._available:
+            return
+
+        self._available = available
+        async_dispatcher_send(self.hass, SIGNAL_RFPLAYER_AVAILABILITY, available)  # type: ignore[has-type]
+
     def _send_raw_command(self, call: ServiceCall) -> None:
         client = self._get_client()
         if not client.connected:
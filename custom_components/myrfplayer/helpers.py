@@ -1,20 +1,29 @@
 """Helpers to handle RF device metadata."""
 
-import json
+import functools
+from typing import Any, TypeVar, cast
 
 from custom_components.myrfplayer.device_profiles import ProfileRegistry
 from custom_components.myrfplayer.rfplayerlib.device import RfDeviceEvent, RfDeviceId
 from custom_components.myrfplayer.rfplayerlib.protocol import RfPlayerEventData
 from homeassistant.const import CONF_ADDRESS, CONF_EVENT_DATA, CONF_MODEL, CONF_PROFILE_NAME, CONF_PROTOCOL
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads_object
 
-from .const import CONF_REDIRECT_ADDRESS, DOMAIN
+from .const import CONF_REDIRECT_ADDRESS, DOMAIN, SIGNAL_RFPLAYER_DEVICE_EVENT, SIGNAL_RFPLAYER_GROUP_EVENT
+
+_EntityDescriptionT = TypeVar("_EntityDescriptionT", bound=EntityDescription)
 
 
 def get_device_id_string_from_identifiers(
     identifiers: set[tuple[str, str]],
 ) -> str | None:
     """Calculate the device id from a device identifier."""
-    return next((x[1] for x in identifiers if x[0] == DOMAIN), None)
+    for domain, id_string in identifiers:
+        if domain == DOMAIN:
+            return id_string
+    return None
 
 
 def get_identifiers_from_device_id(
@@ -24,6 +33,41 @@ def get_identifiers_from_device_id(
     return {(DOMAIN, device.id_string)}
 
 
+def get_entity_description(description_class: type[_EntityDescriptionT], **fields: Any) -> _EntityDescriptionT:
+    """Get the entity description built from some fields.
+
+    Descriptions are immutable and shared by all the entities built with the same fields.
+    """
+    return cast(_EntityDescriptionT, _entity_description(description_class, frozenset(fields.items())))
+
+
+@functools.lru_cache(maxsize=512)
+def _entity_description(
+    description_class: type[EntityDescription], fields: frozenset[tuple[str, Any]]
+) -> EntityDescription:
+    return description_class(**dict(fields))
+
+
+def get_device_event_signal(device: RfDeviceId) -> str:
+    """Calculate the dispatcher signal for events of a single device."""
+    return SIGNAL_RFPLAYER_DEVICE_EVENT.format(device.id_string)
+
+
+def get_group_event_signal(device: RfDeviceId) -> str | None:
+    """Calculate the dispatcher signal for events of a device group, if the device belongs to one."""
+    return _group_event_signal(device.protocol, device.address)
+
+
+# Group signals are computed for every received event and need the address to be parsed, cache them per device
+@functools.lru_cache(maxsize=1024)
+def _group_event_signal(protocol: str, address: str) -> str | None:
+    try:
+        group_code = RfDeviceId(protocol=protocol, address=address).group_code
+    except ValueError:
+        return None
+    return SIGNAL_RFPLAYER_GROUP_EVENT.format(protocol, group_code) if group_code is not None else None
+
+
 def build_device_id_from_device_info(device_info: dict) -> RfDeviceId:
     """Create an RF device event from a device info map."""
     protocol = device_info[CONF_PROTOCOL]
@@ -35,7 +79,7 @@ def build_device_id_from_device_info(device_info: dict) -> RfDeviceId:
 def build_event_data_from_device_info(device_info: dict) -> RfPlayerEventData | None:
     """Create an RF device event from a device info map."""
     event_json_data = device_info.get(CONF_EVENT_DATA)
-    return RfPlayerEventData(json.loads(event_json_data)) if event_json_data else None
+    return RfPlayerEventData(json_loads_object(event_json_data)) if event_json_data else None
 
 
 def build_device_info_from_event(profile_registy: ProfileRegistry, event: RfDeviceEvent) -> dict[str, str | None]:
@@ -47,5 +91,5 @@ def build_device_info_from_event(profile_registy: ProfileRegistry, event: RfDevi
     device_info[CONF_MODEL] = event.device.model
     device_info[CONF_REDIRECT_ADDRESS] = None
     device_info[CONF_PROFILE_NAME] = profile_registy.get_profile_name_from_event(event.data)
-    device_info[CONF_EVENT_DATA] = json.dumps(event.data)
+    device_info[CONF_EVENT_DATA] = json_dumps(event.data)
     return device_info
@@ -73,7 +73,6 @@ class MyRfPlayerLight(RfDeviceEntity, LightEntity):
         self.entity_description = entity_description
         assert isinstance(platform_config, RfpLightConfig)
         self._config = cast(RfpLightConfig, platform_config)
-        self._event_data = event_data
 
     async def async_added_to_hass(self) -> None:
         """Restore light device state (On/Off)."""
@@ -92,14 +91,12 @@ class MyRfPlayerLight(RfDeviceEntity, LightEntity):
         self._attr_is_on = True
         if brightness is None or not self._config.cmd_set_level:
             _LOGGER.debug("turn on %s", self.entity_id)
-            await self._send_command(self._config.make_cmd_turn_on(**self._command_parameters()))
+            self._send_command(self._config.make_cmd_turn_on(**self._command_parameters()))
             self._attr_brightness = 255
         else:
             brightness_pct = brightness * 100 // 255
             _LOGGER.debug("turn on %s with brightness %f", self.entity_id, brightness_pct)
-            await self._send_command(
-                self._config.make_cmd_set_level(**self._command_parameters(brightness=brightness_pct))
-            )
+            self._send_command(self._config.make_cmd_set_level(**self._command_parameters(brightness=brightness_pct)))
             self._attr_brightness = brightness
 
         self.async_write_ha_state()
@@ -107,7 +104,7 @@ class MyRfPlayerLight(RfDeviceEntity, LightEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
         _LOGGER.debug("turn off %s", self.entity_id)
-        await self._send_command(self._config.make_cmd_turn_off(**self._command_parameters()))
+        self._send_command(self._config.make_cmd_turn_off(**self._command_parameters()))
         self._attr_is_on = False
         self._attr_brightness = 0
         self.async_write_ha_state()
@@ -2,7 +2,7 @@
 
 import asyncio
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from typing import cast
@@ -101,6 +101,11 @@ class RfPlayerClient:
     verbose: bool = False
     _protocol: RfplayerProtocol | None = None
     _adapter: RfDeviceEventAdapter | None = None
+    _init_script: tuple[str, ...] = field(init=False, default=())
+
+    def __post_init__(self) -> None:
+        """Build the init script once, it is replayed on every reconnection."""
+        self._init_script = self._build_init_script()
 
     async def connect(self) -> None:
         """Open connection with RfPlayer gateway."""
@@ -116,7 +121,7 @@ class RfPlayerClient:
             loop=self.loop,
             event_callback=self._adapter.raw_event_callback,
             disconnect_callback=self._disconnect_callback_internal,
-            init_script=self._init_script(),
+            init_script=self._init_script,
             verbose=self.verbose,
         )
         try:
@@ -158,7 +163,7 @@ class RfPlayerClient:
             raise RfPlayerException("Not connected")
 
         assert self._adapter
-        self._adapter.raw_event_callback(RfPlayerEventData(event_data))
+        self._adapter.raw_event_callback(RfPlayerEventData(event_data), simulated=True)
 
     @property
     def connected(self) -> bool:
@@ -176,11 +181,11 @@ class RfPlayerClient:
         self.close()
         self.disconnect_callback(ex)
 
-    def _init_script(self) -> list[str]:
+    def _build_init_script(self) -> tuple[str, ...]:
         result = []
         if self.receiver_protocols:
             result.append(f"RECEIVER -* +{' +'.join(self.receiver_protocols)}")
         if self.init_commands:
             result.extend(self.init_commands.splitlines())
 
-        return result
+        return tuple(result)
@@ -1,8 +1,9 @@
 """RfPlayer device info extraction."""
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+import sys
 from typing import Any
 
 from .protocol import RfPlayerEventData
@@ -11,27 +12,30 @@ _LOGGER = logging.getLogger(__name__)
 
 UNKNOWN_INFO = "unknown"
 
+# Candidate infos keys, by order of preference
+_MODEL_KEYS = ("id_PHYMeaning", "subTypeMeaning")
+_ADDRESS_KEYS = ("id", "id_channel", "adr_channel")
+_SWITCH_MODELS = frozenset(("on", "off"))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RfDeviceId:
     """Identifiers of a RF device or the RfPlayer gateway itself."""
 
     protocol: str
     address: str
     model: str | None
+    id_string: str = field(init=False, repr=False, compare=False)
+    """Unique device id string."""
 
     def __init__(self, protocol: str, address: str, *, model: str | None = None):
         """Create a new RF device id."""
 
-        self.protocol = protocol
-        self.address = address
-        self.model = model
-
-    @property
-    def id_string(self) -> str:
-        """Build a unique device id for the device."""
-
-        return f"{self.protocol}-{self.address}"
+        object.__setattr__(self, "protocol", protocol)
+        object.__setattr__(self, "address", address)
+        object.__setattr__(self, "model", model)
+        # Interned as it is used as a lookup key for every received event
+        object.__setattr__(self, "id_string", sys.intern(f"{protocol}-{address}"))
 
     @property
     def pairing_code(self) -> str | None:
@@ -74,12 +78,14 @@ class RfDeviceId:
         return self.address
 
 
-@dataclass
+@dataclass(slots=True)
 class RfDeviceEvent:
     """Device-oriented event after processing a raw RfPlayer event."""
 
     device: RfDeviceId
     data: RfPlayerEventData
+    simulated: bool = False
+    """Event injected by the client instead of received from the RfPlayer."""
 
 
 @dataclass
@@ -88,28 +94,28 @@ class RfDeviceEventAdapter:
 
     device_event_callback: Callable[[RfDeviceEvent], None]
 
-    def raw_event_callback(self, event_data: RfPlayerEventData):
+    def raw_event_callback(self, event_data: RfPlayerEventData, simulated: bool = False):
         """Convert raw RfPlayer event to RF Device event."""
 
         device = self._parse_json_device(event_data)
-        self.device_event_callback(RfDeviceEvent(device=device, data=event_data))
+        self.device_event_callback(RfDeviceEvent(device=device, data=event_data, simulated=simulated))
 
     def _convert_raw_model(self, raw_model: str) -> str:
-        if raw_model.lower() in ["on", "off"]:
+        if raw_model.lower() in _SWITCH_MODELS:
             return "switch"
 
         return raw_model
 
     def _get_model(self, infos: dict[str, Any]) -> str:
-        for key in ["id_PHYMeaning", "subTypeMeaning"]:
-            if key in infos:
-                return self._convert_raw_model(infos[key])
+        for key in _MODEL_KEYS:
+            if (model := infos.get(key)) is not None:
+                return self._convert_raw_model(model)
         return UNKNOWN_INFO
 
     def _get_address(self, infos: dict[str, Any]) -> str:
-        for key in ["id", "id_channel", "adr_channel"]:
-            if key in infos:
-                return infos[key]
+        for key in _ADDRESS_KEYS:
+            if (address := infos.get(key)) is not None:
+                return address
         return UNKNOWN_INFO
 
     def _parse_json_device(self, json_packet: dict[str, Any]) -> RfDeviceId:
@@ -5,6 +5,7 @@ from typing import cast
 
 from custom_components.myrfplayer.device_profiles import AnyRfpPlatformConfig, RfpPlatformConfig, RfpSensorConfig
 from custom_components.myrfplayer.entity import RfDeviceEntity, async_setup_platform_entry
+from custom_components.myrfplayer.helpers import get_entity_description
 from custom_components.myrfplayer.rfplayerlib.device import RfDeviceId
 from custom_components.myrfplayer.rfplayerlib.protocol import RfPlayerEventData
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription, SensorStateClass
@@ -21,7 +22,8 @@ def _get_entity_description(
     config: AnyRfpPlatformConfig, event_data: RfPlayerEventData | None
 ) -> SensorEntityDescription:
     assert isinstance(config, RfpSensorConfig)
-    return SensorEntityDescription(
+    return get_entity_description(
+        SensorEntityDescription,
         key=config.name,
         device_class=SensorDeviceClass(config.device_class) if config.device_class else None,
         state_class=SensorStateClass(config.state_class) if config.state_class else SensorStateClass.MEASUREMENT,
@@ -79,21 +81,21 @@ class MyRfPlayerSensor(RfDeviceEntity, SensorEntity):
         self.entity_description = entity_description
         assert isinstance(platform_config, RfpSensorConfig)
         self._config = cast(RfpSensorConfig, platform_config)
-        self._event_data = event_data
 
     def _apply_event(self, event_data: RfPlayerEventData) -> bool:
         """Apply command from RfPlayer."""
         super()._apply_event(event_data)
 
-        str_value = self._config.state.get_value(event_data)
-        if not str_value:
-            _LOGGER.info("Missing sensor value")
-            return False
-
         try:
-            self._attr_native_value = float(str_value)
+            value = self._config.state.get_number(event_data)
         except ValueError:
-            _LOGGER.info("Ignoring non numeric value %s", str_value)
+            _LOGGER.info("Ignoring non numeric value %s", self._config.state.get_raw_value(event_data))
             return False
 
+        if value is None:
+            _LOGGER.info("Missing sensor value")
+            return False
+
+        self._attr_native_value = value
+
         return True
@@ -74,14 +74,14 @@ class MyRfPlayerSwitch(RfDeviceEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
         _LOGGER.debug("turn on %s", self.entity_id)
-        await self._send_command(self._config.make_cmd_turn_on(**self._command_parameters()))
+        self._send_command(self._config.make_cmd_turn_on(**self._command_parameters()))
         self._attr_is_on = True
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
         _LOGGER.debug("turn off %s", self.entity_id)
-        await self._send_command(self._config.make_cmd_turn_off(**self._command_parameters()))
+        self._send_command(self._config.make_cmd_turn_off(**self._command_parameters()))
         self._attr_is_on = False
         self.async_write_ha_state()
 
@@ -1,15 +1,25 @@
+from pathlib import Path
+import re
+
+from pytest_mock import MockerFixture
+
+from custom_components.myrfplayer import device_profiles
 from custom_components.myrfplayer.device_profiles import (
     AnyRfpPlatformConfig,
     ClimateEventTypes,
+    JsonValueConfig,
+    ProfileRegistry,
     RfpClimateConfig,
     RfpCoverConfig,
     RfpLightConfig,
     RfpSensorConfig,
     RfpSwitchConfig,
+    _compile_match,
     _get_profile_registry,
 )
 from custom_components.myrfplayer.rfplayerlib.protocol import RfPlayerEventData
 from homeassistant.const import Platform
+from tests.myrfplayer.constants import OREGON_EVENT_DATA
 from tests.myrfplayer.device_profiles.conftest import AnyTest, ClimateTest, FrameExpectation, SensorTest, StateTest
 
 
@@ -21,6 +31,7 @@ def _get_config(all_config: list[AnyRfpPlatformConfig], name: str) -> AnyRfpPlat
 
 
 REGISTRY = _get_profile_registry(verbose=True)
+PROFILES_PATH = Path(device_profiles.__file__).parent / "device-profiles.yaml"
 
 
 def _get_platform_tests(
@@ -65,6 +76,7 @@ def test_sensor(profile: str, sensor_expectation: FrameExpectation):
         assert isinstance(item, RfpSensorConfig)
         assert isinstance(test, SensorTest)
         assert item.state.get_value(event) == test.value, f"{name} value"
+        assert item.state.get_number(event) == float(test.value), f"{name} numeric value"
         if item.state.unit_path:
             assert item.state.get_unit(event) == test.unit, f"{name} event unit"
         else:
@@ -142,3 +154,52 @@ def test_is_valid_protocol():
 
     assert REGISTRY.is_valid_protocol("X10|CHACON|KD101|BLYSS|FS20 On/Off", "OREGON") is False
     assert REGISTRY.is_valid_protocol("X10|CHACON|KD101|BLYSS|FS20 On/Off", "CHACON") is True
+
+
+def test_profile_name_cached_per_event_shape(mocker: MockerFixture):
+    registry = ProfileRegistry(PROFILES_PATH, verbose=False)
+    spy = mocker.spy(registry, "_event_is_matching")
+
+    profile_name = registry.get_profile_name_from_event(RfPlayerEventData(OREGON_EVENT_DATA))
+    assert profile_name == "Oregon Rain Sensor"
+    match_count = spy.call_count
+
+    assert registry.get_profile_name_from_event(RfPlayerEventData(OREGON_EVENT_DATA)) == profile_name
+    assert spy.call_count == match_count
+
+
+def test_simple_path_matches_jsonpath():
+    event = RfPlayerEventData(OREGON_EVENT_DATA)
+    simple = JsonValueConfig(value_path="$.frame.header.rfLevel")
+    bracketed = JsonValueConfig(value_path="$['frame']['header']['rfLevel']")
+
+    assert simple.get_value(event) == bracketed.get_value(event) == OREGON_EVENT_DATA["frame"]["header"]["rfLevel"]
+    assert JsonValueConfig(value_path="$.frame.header.missing").get_value(event) is None
+    assert JsonValueConfig(value_path="$.frame.header.rfLevel.missing").get_value(event) is None
+
+
+def test_filter_path_matches_jsonpath():
+    event = RfPlayerEventData(OREGON_EVENT_DATA)
+    filtered = JsonValueConfig(value_path="$.frame.infos.measures[?(@.type=='current rain')].value")
+    # Same filter, but not recognized by the fast path
+    jsonpath = JsonValueConfig(value_path="$.frame['infos'].measures[?(@.type=='current rain')].value")
+
+    assert filtered.get_value(event) == jsonpath.get_value(event) == "0.00"
+    assert JsonValueConfig(value_path="$.frame.infos.measures[?(@.type=='uv')].value").get_value(event) is None
+    assert JsonValueConfig(value_path="$.frame.infos.lowBatt[?(@.type=='uv')].value").get_value(event) is None
+
+
+def test_filter_path_on_map_matches_jsonpath():
+    event = RfPlayerEventData({"frame": {"infos": {"m": {"a": {"type": "x", "value": "1"}, "b": {"type": "y"}}}}})
+    filtered = JsonValueConfig(value_path="$.frame.infos.m[?(@.type=='x')].value")
+    jsonpath = JsonValueConfig(value_path="$.frame['infos'].m[?(@.type=='x')].value")
+
+    assert filtered.get_value(event) == jsonpath.get_value(event) == "1"
+    assert JsonValueConfig(value_path="$.frame.infos.m[?(@.type=='y')].value").get_value(event) is None
+
+
+def test_compiled_match_same_as_regex():
+    for pattern in ("X10|CHACON|KD101", "OREGON", "0x0|0x0000", "OREGON.*", "X2D[0-9]+"):
+        match = _compile_match(pattern)
+        for value in ("X10", "CHACON", "KD1", "OREGONV3", "OREG", "0x0000", "0x1", "X2D433", "X2D"):
+            assert match(value) == (re.match(pattern, value) is not None), f"{pattern} {value}"
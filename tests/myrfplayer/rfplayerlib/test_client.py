@@ -52,6 +52,7 @@ async def test_simulator(mocker: MockerFixture):
     event = cast(RfDeviceEvent, event_callback.call_args.args[0])  # First argument of last call
     assert event.device == RfDeviceId(protocol="OREGON", address=OREGON_ADDRESS, model="PCR800")
     assert event.data == OREGON_EVENT_DATA
+    assert event.simulated
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,9 @@
+from dataclasses import FrozenInstanceError, replace
 from typing import cast
 from unittest.mock import Mock
 
+import pytest
+
 from custom_components.myrfplayer.rfplayerlib.device import RfDeviceEvent, RfDeviceEventAdapter, RfDeviceId
 from tests.myrfplayer.constants import BLYSS_ADDRESS, BLYSS_OFF_EVENT_DATA, OREGON_ADDRESS, OREGON_EVENT_DATA
 
@@ -55,3 +58,15 @@ def test_group_unit_code():
     assert device.pairing_code == str(0x304C9E87)
     assert device.group_code is None
     assert device.unit_code == str(0x304C9E87)
+
+
+def test_device_id_is_immutable():
+    device = RfDeviceId(protocol="OREGON", address=OREGON_ADDRESS, model="PCR800")
+    assert device.id_string == f"OREGON-{OREGON_ADDRESS}"
+
+    with pytest.raises(FrozenInstanceError):
+        device.address = "0"  # type: ignore[misc]
+
+    redirected = replace(device, address="0")
+    assert redirected.id_string == "OREGON-0"
+    assert redirected.model == "PCR800"
@@ -69,6 +69,27 @@ def test_received_incomplete(test_protocol: RfplayerProtocol):
     cb.assert_has_calls([call(json.loads(bodies[0])), call(json.loads(bodies[1]))])
 
 
+def test_received_split_multibyte(test_protocol: RfplayerProtocol):
+    body = '{"foo": "b\u00e9r"}'
+    payload = f"ZIA33{body}\n\r".encode()
+    split = payload.index("\u00e9".encode()) + 1
+
+    test_protocol.data_received(payload[:split])
+    test_protocol.data_received(payload[split:])
+
+    cb = cast(Mock, test_protocol.event_callback)
+    cb.assert_called_once_with(json.loads(body))
+
+
+def test_received_undecodable_line(test_protocol: RfplayerProtocol):
+    body = '{"foo": "bar"}'
+
+    test_protocol.data_received(b"ZIA33\xff\xfe\n\r" + f"ZIA33{body}\n\r".encode())
+
+    cb = cast(Mock, test_protocol.event_callback)
+    cb.assert_called_once_with(json.loads(body))
+
+
 def test_received_strip(test_protocol: RfplayerProtocol):
     body = '{"foo": "bar"}'
 
@@ -22,6 +22,9 @@ from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers import device_registry as dr
 from tests.myrfplayer.conftest import create_rfplayer_test_cfg
 from tests.myrfplayer.constants import (
+    BLYSS_MOTION_ADDRESS,
+    BLYSS_MOTION_DEVICE_INFO,
+    BLYSS_MOTION_ID_STRING,
     CHACON_BINARY_SENSOR_DEVICE_INFO,
     OREGON_ADDRESS,
     OREGON_BINARY_SENSOR_ENTITY_ID,
@@ -177,6 +180,37 @@ async def test_options_gateway(serial_connection_mock: Mock, hass: HomeAssistant
     assert entry.data["verbose_mode"] is True
 
 
+@pytest.mark.asyncio
+async def test_options_gateway_unchanged(serial_connection_mock: Mock, hass: HomeAssistant) -> None:
+    """Test saving unchanged gateway options does not reload the entry."""
+
+    entry_data = create_rfplayer_test_cfg()
+    entry_data["init_commands"] = "PING"
+    entry = MockConfigEntry(domain=DOMAIN, data=entry_data, unique_id=DOMAIN)
+    result = await start_options_flow(hass, entry)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"next_step_id": "configure_gateway"},
+    )
+
+    with patch.object(hass.config_entries, "async_reload") as reload_mock:
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                "automatic_add": entry.data["automatic_add"],
+                "reconnect_interval": entry.data["reconnect_interval"],
+                "receiver_protocols": [],
+                "init_commands": "PING",
+                "verbose_mode": entry.data["verbose_mode"],
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    reload_mock.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_options_gateway_no_receiver_protocols(serial_connection_mock: Mock, hass: HomeAssistant) -> None:
     """Test we set protocols to None if none are selected."""
@@ -423,6 +457,84 @@ async def test_options_configure_rf_device(
     assert entry.data["devices"][OREGON_ID_STRING]["profile_name"] == OREGON_DEVICE_INFO["profile_name"]
 
 
+@pytest.mark.asyncio
+async def test_options_configure_rf_device_keeps_other_redirects(
+    serial_connection_mock: Mock, hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test that configuring a device leaves the redirects of other devices untouched."""
+
+    redirect_id_string = f"OREGON-{OREGON_REDIRECT_ADDRESS}"
+    entry_data = create_rfplayer_test_cfg(
+        devices={
+            OREGON_ID_STRING: {**OREGON_DEVICE_INFO, "redirect_address": OREGON_REDIRECT_ADDRESS},
+            BLYSS_MOTION_ID_STRING: BLYSS_MOTION_DEVICE_INFO,
+        }
+    )
+    entry_data["redirect_address"] = {redirect_id_string: OREGON_ID_STRING}
+    entry = MockConfigEntry(domain=DOMAIN, data=entry_data, unique_id=DOMAIN)
+    result = await start_options_flow(hass, entry)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"next_step_id": "configure_rf_device"},
+    )
+
+    device_id = RfDeviceId(protocol="BLYSS", address=BLYSS_MOTION_ADDRESS)
+    device_entry = device_registry.async_get_device(identifiers=get_identifiers_from_device_id(device_id))
+    assert device_entry
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"device": device_entry.id, "redirect_address": "4261583731"},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+
+    await hass.async_block_till_done()
+
+    assert entry.data["redirect_address"] == {
+        redirect_id_string: OREGON_ID_STRING,
+        "BLYSS-4261583731": BLYSS_MOTION_ID_STRING,
+    }
+
+
+@pytest.mark.asyncio
+async def test_options_configure_rf_device_drops_removed_redirects(
+    serial_connection_mock: Mock, hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test that configuring a device drops the redirects to removed devices."""
+
+    entry_data = create_rfplayer_test_cfg(
+        devices={
+            BLYSS_MOTION_ID_STRING: BLYSS_MOTION_DEVICE_INFO,
+        }
+    )
+    # Redirect left behind by a removed OREGON device
+    entry_data["redirect_address"] = {f"OREGON-{OREGON_REDIRECT_ADDRESS}": OREGON_ID_STRING}
+    entry = MockConfigEntry(domain=DOMAIN, data=entry_data, unique_id=DOMAIN)
+    result = await start_options_flow(hass, entry)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"next_step_id": "configure_rf_device"},
+    )
+
+    device_id = RfDeviceId(protocol="BLYSS", address=BLYSS_MOTION_ADDRESS)
+    device_entry = device_registry.async_get_device(identifiers=get_identifiers_from_device_id(device_id))
+    assert device_entry
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"device": device_entry.id, "redirect_address": "4261583731"},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+
+    await hass.async_block_till_done()
+
+    assert entry.data["redirect_address"] == {"BLYSS-4261583731": BLYSS_MOTION_ID_STRING}
+
+
 def test_get_serial_by_id_no_dir() -> None:
     """Test serial by id conversion if there's no /dev/serial/by-id."""
     p1 = patch("os.path.isdir", MagicMock(return_value=False))
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import json
 from typing import cast
 from unittest.mock import ANY, Mock
 
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 from pytest_homeassistant_custom_component.typing import WebSocketGenerator
 from pytest_mock import MockerFixture
 from serial import SerialException
 
 from custom_components.myrfplayer.const import DOMAIN, RFPLAYER_CLIENT, SIGNAL_RFPLAYER_EVENT
+from custom_components.myrfplayer.helpers import get_device_event_signal
 from custom_components.myrfplayer.rfplayerlib import RfPlayerClient
 from custom_components.myrfplayer.rfplayerlib.device import RfDeviceEvent, RfDeviceId
 from custom_components.myrfplayer.rfplayerlib.protocol import RfPlayerEventData, RfplayerProtocol
@@ -21,6 +24,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from tests.myrfplayer.constants import (
     BLYSS_ADDRESS,
     BLYSS_ID_STRING,
@@ -103,6 +107,92 @@ async def test_fire_event(
     assert calls[2].device.id_string == BLYSS_ID_STRING
 
 
+@pytest.mark.asyncio
+async def test_repeated_sensor_event(serial_connection_mock: Mock, hass: HomeAssistant, mocker: MockerFixture) -> None:
+    """Test that repeated sensor frames are only forwarded once the duplicate window is over."""
+    await setup_rfplayer_test_cfg(hass, automatic_add=True)
+
+    calls: list[RfDeviceEvent] = []
+
+    @callback
+    def record_event(event: RfDeviceEvent):
+        """Add recorded event to set."""
+        calls.append(event)
+
+    async_dispatcher_connect(hass, SIGNAL_RFPLAYER_EVENT, record_event)  # type: ignore[has-type]
+
+    client = cast(RfPlayerClient, hass.data[DOMAIN][RFPLAYER_CLIENT])
+
+    def send_oregon_event():
+        client.event_callback(
+            RfDeviceEvent(
+                device=RfDeviceId(protocol="OREGON", address=OREGON_ADDRESS, model="PCR800"),
+                data=RfPlayerEventData(OREGON_EVENT_DATA),
+            )
+        )
+
+    send_oregon_event()
+    send_oregon_event()
+    assert len(calls) == 1
+
+    mocker.patch("custom_components.myrfplayer.gateway.DUPLICATE_EVENT_WINDOW", 0)
+    send_oregon_event()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_command_event(serial_connection_mock: Mock, hass: HomeAssistant) -> None:
+    """Test that repeated command frames always reach the device entities."""
+    await setup_rfplayer_test_cfg(hass, automatic_add=True)
+
+    calls: list[RfDeviceEvent] = []
+
+    @callback
+    def record_event(event: RfDeviceEvent):
+        """Add recorded event to set."""
+        calls.append(event)
+
+    device = RfDeviceId(protocol="BLYSS", address=BLYSS_ADDRESS)
+    async_dispatcher_connect(hass, get_device_event_signal(device), record_event)  # type: ignore[has-type]
+
+    client = cast(RfPlayerClient, hass.data[DOMAIN][RFPLAYER_CLIENT])
+
+    for _ in range(2):
+        client.event_callback(RfDeviceEvent(device=device, data=RfPlayerEventData(BLYSS_OFF_EVENT_DATA)))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_auto_add_batched_entry_update(serial_connection_mock: Mock, hass: HomeAssistant) -> None:
+    """Test that devices discovered in a burst are saved with a single entry update."""
+    entry = await setup_rfplayer_test_cfg(hass, automatic_add=True)
+
+    client = cast(RfPlayerClient, hass.data[DOMAIN][RFPLAYER_CLIENT])
+
+    client.event_callback(
+        RfDeviceEvent(
+            device=RfDeviceId(protocol="OREGON", address=OREGON_ADDRESS, model="PCR800"),
+            data=RfPlayerEventData(OREGON_EVENT_DATA),
+        )
+    )
+    client.event_callback(
+        RfDeviceEvent(
+            device=RfDeviceId(protocol="BLYSS", address=BLYSS_ADDRESS),
+            data=RfPlayerEventData(BLYSS_OFF_EVENT_DATA),
+        )
+    )
+
+    assert OREGON_ID_STRING not in entry.data["devices"]
+    assert BLYSS_ID_STRING not in entry.data["devices"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert OREGON_ID_STRING in entry.data["devices"]
+    assert BLYSS_ID_STRING in entry.data["devices"]
+
+
 @pytest.mark.asyncio
 async def test_send_raw_command(
     serial_connection_mock: Mock, hass: HomeAssistant, test_protocol: RfplayerProtocol
@@ -143,7 +233,19 @@ async def test_simulate_event(
     """Test configuration."""
     await setup_rfplayer_test_cfg(hass, device="/dev/null", automatic_add=True, devices={})
 
-    await hass.services.async_call("myrfplayer", "simulate_event", {"event_data": OREGON_EVENT_DATA}, blocking=True)
+    calls: list[RfDeviceEvent] = []
+
+    @callback
+    def record_event(event: RfDeviceEvent):
+        """Add recorded event to set."""
+        calls.append(event)
+
+    async_dispatcher_connect(hass, SIGNAL_RFPLAYER_EVENT, record_event)  # type: ignore[has-type]
+
+    # Simulated events are never dropped as retransmissions
+    for _ in range(2):
+        await hass.services.async_call("myrfplayer", "simulate_event", {"event_data": OREGON_EVENT_DATA}, blocking=True)
+    assert len(calls) == 2
 
     device_oregon = device_registry.async_get_device(identifiers={(DOMAIN, OREGON_ID_STRING)})
     assert device_oregon is not None
@@ -1,3 +1,4 @@
+import copy
 import json
 from typing import cast
 from unittest.mock import Mock
@@ -110,3 +111,25 @@ async def test_state_restore(serial_connection_mock: Mock, hass: HomeAssistant)
     state = hass.states.get(OREGON_RAIN_SENSOR_ENTITY_ID)
     assert state
     assert state.state == OREGON_RAIN_SENSOR_STATE
+
+
+@pytest.mark.asyncio
+async def test_non_numeric_value(serial_connection_mock: Mock, hass: HomeAssistant):
+    await setup_rfplayer_test_cfg(hass, device="/dev/serial/by-id/usb-rfplayer-port0", automatic_add=True)
+
+    client = cast(RfPlayerClient, hass.data[DOMAIN][RFPLAYER_CLIENT])
+    device = RfDeviceId(protocol="OREGON", address=OREGON_ADDRESS)
+    client.event_callback(RfDeviceEvent(device=device, data=RfPlayerEventData(OREGON_EVENT_DATA)))
+    await hass.async_block_till_done()
+
+    event_data = copy.deepcopy(OREGON_EVENT_DATA)
+    for measure in event_data["frame"]["infos"]["measures"]:
+        if measure["type"] == "total rain":
+            measure["value"] = "n/a"
+    client.event_callback(RfDeviceEvent(device=device, data=RfPlayerEventData(event_data)))
+    await hass.async_block_till_done()
+
+    # Non numeric values are ignored and the previous state is kept
+    state = hass.states.get(OREGON_RAIN_SENSOR_ENTITY_ID)
+    assert state
+    assert state.state == OREGON_RAIN_SENSOR_STATE
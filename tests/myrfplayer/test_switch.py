@@ -25,6 +25,7 @@ from homeassistant.core import HomeAssistant, State
 from tests.myrfplayer.conftest import create_rfplayer_test_cfg, setup_rfplayer_test_cfg
 from tests.myrfplayer.constants import (
     CHACON_ADDRESS,
+    CHACON_BINARY_SENSOR_ENTITY_ID,
     CHACON_ID_STRING,
     CHACON_ON_EVENT_DATA,
     CHACON_SWITCH_DEVICE_INFO,
@@ -108,6 +109,25 @@ async def test_automatic_add(serial_connection_mock: Mock, hass: HomeAssistant,
     assert state.attributes.get(ATTR_FRIENDLY_NAME) == CHACON_SWITCH_FRIENDLY_NAME
 
 
+@pytest.mark.asyncio
+async def test_automatic_add_keeps_configured_profile(serial_connection_mock: Mock, hass: HomeAssistant):
+    await setup_rfplayer_test_cfg(hass, automatic_add=True, devices={CHACON_ID_STRING: CHACON_SWITCH_DEVICE_INFO})
+
+    client = cast(RfPlayerClient, hass.data[DOMAIN][RFPLAYER_CLIENT])
+    client.event_callback(
+        RfDeviceEvent(
+            device=RfDeviceId(protocol="CHACON", address=CHACON_ADDRESS),
+            data=RfPlayerEventData(CHACON_ON_EVENT_DATA),
+        )
+    )
+
+    await hass.async_block_till_done()
+
+    assert hass.states.get(CHACON_SWITCH_ENTITY_ID)
+    # The event matches the On/Off profile but the device is already configured as a switch
+    assert hass.states.get(CHACON_BINARY_SENSOR_ENTITY_ID) is None
+
+
 @pytest.mark.asyncio
 async def test_state_restore(serial_connection_mock: Mock, hass: HomeAssistant) -> None:
     mock_restore_cache(